@@ -105,6 +105,11 @@ class UnsupervisedSampler:
         # Setup an interal random state with the given seed
         _, self.np_random = random_state(seed)
 
+        # the negative sampling distribution, and the root nodes that have neighbours, are computed
+        # the first time they are needed
+        self._sampling_cdf = None
+        self._walkable_root_ilocs = None
+
     def run(self, batch_size):
         """
         This method returns a batch_size number of positive and negative samples from the graph.
@@ -126,46 +131,140 @@ class UnsupervisedSampler:
         """
         self._check_parameter_values(batch_size)
 
-        all_nodes = list(self.graph.nodes())
-        # Use the sampling distribution as per node2vec
-        degrees = self.graph.node_degrees()
-        sampling_distribution = np.array([degrees[n] ** 0.75 for n in all_nodes])
-        sampling_distribution_norm = sampling_distribution / np.sum(
-            sampling_distribution
-        )
-
         walks = self.walker.run(
             nodes=self.nodes, length=self.length, n=self.number_of_walks
         )
 
-        # first item in each walk is the target/head node
-        targets = [walk[0] for walk in walks]
+        pairs, labels = self._context_pairs(walks, self.np_random)
+
+        # shuffle indices - note this doesn't ensure an equal number of positive/negative examples in
+        # each batch, just an equal number overall
+        indices = self.np_random.permutation(len(pairs))
+
+        batch_indices = [
+            indices[i : i + batch_size] for i in range(0, len(indices), batch_size)
+        ]
+
+        return [(pairs[i], labels[i]) for i in batch_indices]
+
+    def batch_root_nodes(self, batch_size, seed=None):
+        """
+        This method splits the root nodes of the walks into batches, for generating the samples of
+        each batch on demand with :meth:`run_batch`. Each root node appears ``number_of_walks`` times,
+        and the root nodes are shuffled across the batches. Root nodes without neighbours are
+        excluded, because their walks produce no samples, so that no batch is empty.
 
+        The number of root nodes in each batch is chosen so that the walks from them produce at most
+        ``batch_size`` positive and negative samples (or exactly ``batch_size``, if no walks end
+        early at a node without neighbours). Each batch has at least one root node, so if
+        ``batch_size`` is less than the ``2 * (length - 1)`` samples from a single walk, each batch
+        has one root node and more than ``batch_size`` samples.
+
+        Args:
+             batch_size (int): The number of samples to generate for each batch.
+                This must be an even number.
+             seed (int, optional): Random seed for shuffling the root nodes
+
+        Returns:
+            List of lists of root nodes, one for each batch
+        """
+        self._check_parameter_values(batch_size)
+        _, np_rs = random_state(seed)
+
+        # each walk produces (length - 1) positive samples, and the same number of negative samples
+        roots_per_batch = max(1, batch_size // (2 * (self.length - 1)))
+
+        if self._walkable_root_ilocs is None:
+            self._walkable_root_ilocs = np.array(
+                [
+                    iloc
+                    for iloc, node in enumerate(self.nodes)
+                    if self.walker.neighbors(node)
+                ],
+                dtype=int,
+            )
+
+        # shuffle the positions of the root nodes, rather than the nodes themselves, to avoid
+        # coercing node IDs of different types to a single numpy dtype
+        node_ilocs = np.repeat(self._walkable_root_ilocs, self.number_of_walks)
+        node_ilocs = node_ilocs[np_rs.permutation(len(node_ilocs))]
+
+        return [
+            [self.nodes[iloc] for iloc in node_ilocs[i : i + roots_per_batch]]
+            for i in range(0, len(node_ilocs), roots_per_batch)
+        ]
+
+    def run_batch(self, root_nodes, seed=None):
+        """
+        This method returns the positive and negative samples for a single walk from each of the given
+        root nodes, in a random order, such as for a batch from :meth:`batch_root_nodes`.
+
+        Args:
+             root_nodes (iterable): The root nodes of the walks.
+             seed (int, optional): Random seed for the walks and samples
+
+        Returns:
+            A tuple of (array of context pairs, array of labels)
+        """
+        _, np_rs = random_state(seed)
+
+        walks = self.walker.run(nodes=root_nodes, length=self.length, n=1, seed=seed)
+        pairs, labels = self._context_pairs(walks, np_rs)
+
+        indices = np_rs.permutation(len(pairs))
+        return pairs[indices], labels[indices]
+
+    def _context_pairs(self, walks, np_rs):
+        """
+        Computes the positive context pairs from the walks, and the same number of negative context
+        pairs.
+
+        Currently the global node sampling distribution for the negative pairs is the degree
+        distribution to the 3/4 power. This is the same used in node2vec
+        (https://snap.stanford.edu/node2vec/).
+
+        Args:
+            walks (list): the walks, each a list of node IDs starting at the target/head node
+            np_rs: the numpy random state to use for negative sampling
+
+        Returns:
+            A tuple of (array of context pairs, array of labels), with all the positive pairs before
+            all the negative pairs
+        """
+        if self._sampling_cdf is None:
+            # Use the sampling distribution as per node2vec. This is computed once, as its
+            # cumulative distribution, so that sampling for each batch is proportional to the
+            # number of samples rather than the number of nodes (as with np_rs.choice(..., p=...)).
+            all_nodes = list(self.graph.nodes())
+            degrees = self.graph.node_degrees()
+            sampling_distribution = np.array([degrees[n] ** 0.75 for n in all_nodes])
+            self._all_nodes = np.asarray(all_nodes)
+            self._sampling_cdf = np.cumsum(sampling_distribution)
+            # normalise so that the last element is exactly 1, above every np_rs.random_sample()
+            self._sampling_cdf /= self._sampling_cdf[-1]
+
+        # first item in each walk is the target/head node
         positive_pairs = np.array(
             [
-                (target, positive_context)
-                for target, walk in zip(targets, walks)
+                (walk[0], positive_context)
+                for walk in walks
                 for positive_context in walk[1:]
             ]
-        )
+        ).reshape(-1, 2)
 
-        negative_samples = self.np_random.choice(
-            all_nodes, size=len(positive_pairs), p=sampling_distribution_norm
-        )
+        negative_samples = self._all_nodes[
+            np.searchsorted(
+                self._sampling_cdf,
+                np_rs.random_sample(len(positive_pairs)),
+                side="right",
+            )
+        ]
         negative_pairs = np.column_stack((positive_pairs[:, 0], negative_samples))
 
         pairs = np.concatenate((positive_pairs, negative_pairs), axis=0)
         labels = np.repeat([1, 0], len(positive_pairs))
 
-        # shuffle indices - note this doesn't ensure an equal number of positive/negative examples in
-        # each batch, just an equal number overall
-        indices = self.np_random.permutation(len(pairs))
-
-        batch_indices = [
-            indices[i : i + batch_size] for i in range(0, len(indices), batch_size)
-        ]
-
-        return [(pairs[i], labels[i]) for i in batch_indices]
+        return pairs, labels
 
     def _check_parameter_values(self, batch_size):
         """
@@ -517,12 +517,15 @@ class CorruptedGenerator:
             )
         self.base_generator = base_generator
 
-    def flow(self, *args, **kwargs):
+    def flow(self, *args, seed=None, **kwargs):
         """
         Creates the corrupted :class: `Sequence` object for training Deep Graph Infomax.
 
         Args:
             args: the positional arguments for the self.base_generator.flow(...) method
+            seed (int, optional): random seed for the shuffling of the node features
             kwargs: the keyword arguments for the self.base_generator.flow(...) method
         """
-        return CorruptedNodeSequence(self.base_generator.flow(*args, **kwargs))
+        return CorruptedNodeSequence(
+            self.base_generator.flow(*args, **kwargs), seed=seed
+        )
@@ -66,7 +66,17 @@ class GraphGenerator:
         self.graphs = graphs
         self.name = name
 
-    def flow(self, graph_ilocs, targets=None, batch_size=1, name=None):
+    def flow(
+        self,
+        graph_ilocs,
+        targets=None,
+        batch_size=1,
+        name=None,
+        bucket_shuffle=False,
+        dense_cache=True,
+        dense_cache_max_bytes=2 ** 28,
+        n_jobs=None,
+    ):
         """
         Creates a generator/sequence object for training, evaluation, or prediction
         with the supplied graph indexes and targets.
@@ -78,6 +88,15 @@ class GraphGenerator:
                 len(targets))`.
             batch_size (int, optional): The batch size.
             name (str, optional): An optional name for the returned generator object.
+            bucket_shuffle (bool, optional): If True, each batch is formed from graphs of similar
+                sizes to reduce padding, and the order of the batches is shuffled every epoch.
+            dense_cache (bool, optional): If True, and they fit in ``dense_cache_max_bytes``, the
+                padded dense adjacency matrices of all graphs are computed once and stored.
+                Otherwise, they're converted from sparse for each batch.
+            dense_cache_max_bytes (int, optional): The maximum memory, in bytes, to use for the
+                dense adjacency matrices.
+            n_jobs (int, optional): The number of threads to use to compute the adjacency
+                matrices. If None, this is chosen based on the number of CPUs.
 
         Returns:
             A :class:`GraphSequence` object to use with Keras methods :meth:`fit`, :meth:`evaluate`, and :meth:`predict`
@@ -101,4 +120,8 @@ class GraphGenerator:
             targets=targets,
             batch_size=batch_size,
             name=name,
+            bucket_shuffle=bucket_shuffle,
+            dense_cache=dense_cache,
+            dense_cache_max_bytes=dense_cache_max_bytes,
+            n_jobs=n_jobs,
         )
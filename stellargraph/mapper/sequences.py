@@ -33,10 +33,12 @@ import warnings
 import operator
 import random
 import collections
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import itertools as it
 import networkx as nx
 import scipy.sparse as sps
+import tensorflow as tf
 from tensorflow.keras import backend as K
 from functools import reduce
 from tensorflow.keras.utils import Sequence
@@ -47,6 +49,91 @@ from scipy import sparse
 from ..core.experimental import experimental
 
 
+def _ids_to_array(ids):
+    """
+    Store node or link IDs as a numpy array, so that a batch can be gathered with a single fancy
+    index.
+
+    Args:
+        ids (iterable): node IDs, or link IDs as ``(src, dst)`` tuples
+
+    Returns:
+        A numpy array of the IDs, with shape ``(N,)`` for node IDs or ``(N, 2)`` for link IDs. IDs of
+        mixed types (e.g. ints and strings) are stored with ``object`` dtype, so that they are not
+        coerced to a common type.
+    """
+    ids = list(ids)
+    as_objects = np.asarray(ids, dtype=object)
+    if len({type(x) for x in as_objects.ravel()}) > 1:
+        return as_objects
+
+    return np.asarray(ids)
+
+
+def _sampled_sequence_to_tf_dataset(sequence, num_parallel_calls):
+    """
+    Creates a ``tf.data.Dataset`` from a :class:`NodeSequence` or :class:`LinkSequence`.
+
+    The ids are shuffled and batched by ``tf.data``, and each batch of indices is passed to the
+    sequence's sampling function via ``tf.py_function``.
+
+    Args:
+        sequence (NodeSequence or LinkSequence): the sequence to draw batches from
+        num_parallel_calls (int): the number of batches to sample in parallel
+
+    Returns:
+        A ``tf.data.Dataset`` yielding ``(features, targets)``, or just ``features`` when the
+        sequence has no targets
+    """
+    # sample one batch to find the number, types and shapes of the arrays in each batch
+    example_feats, example_targets = sequence._sample_batch(
+        np.arange(min(sequence.batch_size, sequence.data_size)), 0
+    )
+    has_targets = example_targets is not None
+    # some sampling functions (e.g. for Attri2Vec) return a single array rather than a list
+    feats_are_list = isinstance(example_feats, (list, tuple))
+
+    def flatten(batch_feats, batch_targets):
+        arrays = list(batch_feats) if feats_are_list else [batch_feats]
+        return arrays + ([batch_targets] if has_targets else [])
+
+    example = flatten(example_feats, example_targets)
+    num_feats = len(example) - has_targets
+
+    dtypes = [tf.as_dtype(np.asarray(arr).dtype) for arr in example]
+    # the first (batch) dimension is smaller for the last batch
+    shapes = [(None,) + np.shape(arr)[1:] for arr in example]
+
+    def sample(batch_num, batch_indices):
+        return flatten(
+            *sequence._sample_batch(batch_indices.numpy(), int(batch_num))
+        )
+
+    def map_func(batch_num, batch_indices):
+        arrays = tf.py_function(sample, [batch_num, batch_indices], dtypes)
+        for arr, shape in zip(arrays, shapes):
+            arr.set_shape(shape)
+
+        feats = tuple(arrays[:num_feats]) if feats_are_list else arrays[0]
+        if has_targets:
+            return feats, arrays[-1]
+        # a 1-tuple, so that Keras doesn't interpret multiple inputs as (x, y, sample_weight)
+        return (feats,)
+
+    dataset = tf.data.Dataset.range(sequence.data_size)
+    if sequence.shuffle:
+        dataset = dataset.shuffle(
+            buffer_size=sequence.data_size, seed=sequence._rs.randrange(2 ** 32)
+        )
+
+    return (
+        dataset.batch(sequence.batch_size)
+        .enumerate()
+        .map(map_func, num_parallel_calls=num_parallel_calls)
+        .prefetch(tf.data.experimental.AUTOTUNE)
+    )
+
+
 class NodeSequence(Sequence):
     """Keras-compatible data generator to use with the Keras
     methods :meth:`keras.Model.fit`, :meth:`keras.Model.evaluate`,
@@ -96,11 +183,12 @@ class NodeSequence(Sequence):
                 )
             )
 
-        self.ids = list(ids)
+        self.ids = _ids_to_array(ids)
         self.data_size = len(self.ids)
         self.shuffle = shuffle
+        self._contiguous = not shuffle
         self.batch_size = batch_size
-        self._rs, _ = random_state(seed)
+        self._rs, self._np_rs = random_state(seed)
 
         # Shuffle IDs to start
         self.on_epoch_end()
@@ -128,11 +216,18 @@ class NodeSequence(Sequence):
             raise IndexError("Mapper: batch_num larger than length of data")
         # print("Fetching batch {} [{}]".format(batch_num, start_idx))
 
-        # The ID indices for this batch
-        batch_indices = self.indices[start_idx:end_idx]
+        # The ID indices for this batch: when the IDs aren't shuffled, they're in order, so a slice
+        # selects the batch as views of the IDs and targets, without a gather
+        if self._contiguous:
+            batch_indices = slice(start_idx, end_idx)
+        else:
+            batch_indices = self.indices[start_idx:end_idx]
+
+        return self._sample_batch(batch_indices, batch_num)
 
+    def _sample_batch(self, batch_indices, batch_num):
         # Get head (root) nodes
-        head_ids = [self.ids[ii] for ii in batch_indices]
+        head_ids = self.ids[batch_indices]
 
         # Get corresponding targets
         batch_targets = None if self.targets is None else self.targets[batch_indices]
@@ -142,13 +237,31 @@ class NodeSequence(Sequence):
 
         return batch_feats, batch_targets
 
+    def to_tf_dataset(self, num_parallel_calls=tf.data.experimental.AUTOTUNE):
+        """
+        Creates a ``tf.data.Dataset`` that yields the same batches as this sequence, with the
+        sampling of batches run in parallel and prefetched while the model is training.
+
+        The dataset is reshuffled on every iteration if ``shuffle`` is True, so it can be passed
+        directly to :meth:`keras.Model.fit` without relying on :meth:`on_epoch_end`.
+
+        Args:
+            num_parallel_calls (int): the number of batches to sample in parallel.
+
+        Returns:
+            A ``tf.data.Dataset`` object to use with the Keras methods :meth:`fit`, :meth:`evaluate`
+            and :meth:`predict`.
+        """
+        return _sampled_sequence_to_tf_dataset(self, num_parallel_calls)
+
     def on_epoch_end(self):
         """
         Shuffle all head (root) nodes at the end of each epoch
         """
-        self.indices = list(range(self.data_size))
         if self.shuffle:
-            self._rs.shuffle(self.indices)
+            self.indices = self._np_rs.permutation(self.data_size)
+        else:
+            self.indices = np.arange(self.data_size)
 
 
 class LinkSequence(Sequence):
@@ -162,6 +275,7 @@ class LinkSequence(Sequence):
     Args:
         sample_function (Callable): A function that returns features for supplied head nodes.
         ids (iterable): Link IDs to batch, each link id being a tuple of (src, dst) node ids.
+            Each batch of link IDs is passed to ``sample_function`` as a ``(batch size, 2)`` array.
         targets (list, optional): A list of targets or labels to be used in the downstream task.
         shuffle (bool): If True (default) the ids will be randomly shuffled every epoch.
         seed (int, optional): Random seed
@@ -201,10 +315,13 @@ class LinkSequence(Sequence):
             )
 
         self.batch_size = batch_size
-        self.ids = list(ids)
+        # store the links as rows of an (N, 2) array, so each batch is a (B, 2) array of
+        # (src, dst) pairs rather than a list of tuples
+        self.ids = _ids_to_array(ids).reshape(-1, 2)
         self.data_size = len(self.ids)
         self.shuffle = shuffle
-        self._rs, _ = random_state(seed)
+        self._contiguous = not shuffle
+        self._rs, self._np_rs = random_state(seed)
 
         # Shuffle the IDs to begin
         self.on_epoch_end()
@@ -230,11 +347,18 @@ class LinkSequence(Sequence):
             raise IndexError("Mapper: batch_num larger than length of data")
         # print("Fetching {} batch {} [{}]".format(self.name, batch_num, start_idx))
 
-        # The ID indices for this batch
-        batch_indices = self.indices[start_idx:end_idx]
+        # The ID indices for this batch: when the IDs aren't shuffled, they're in order, so a slice
+        # selects the batch as views of the IDs and targets, without a gather
+        if self._contiguous:
+            batch_indices = slice(start_idx, end_idx)
+        else:
+            batch_indices = self.indices[start_idx:end_idx]
+
+        return self._sample_batch(batch_indices, batch_num)
 
+    def _sample_batch(self, batch_indices, batch_num):
         # Get head (root) nodes for links
-        head_ids = [self.ids[ii] for ii in batch_indices]
+        head_ids = self.ids[batch_indices]
 
         # Get targets for nodes
         batch_targets = None if self.targets is None else self.targets[batch_indices]
@@ -244,13 +368,31 @@ class LinkSequence(Sequence):
 
         return batch_feats, batch_targets
 
+    def to_tf_dataset(self, num_parallel_calls=tf.data.experimental.AUTOTUNE):
+        """
+        Creates a ``tf.data.Dataset`` that yields the same batches as this sequence, with the
+        sampling of batches run in parallel and prefetched while the model is training.
+
+        The dataset is reshuffled on every iteration if ``shuffle`` is True, so it can be passed
+        directly to :meth:`keras.Model.fit` without relying on :meth:`on_epoch_end`.
+
+        Args:
+            num_parallel_calls (int): the number of batches to sample in parallel.
+
+        Returns:
+            A ``tf.data.Dataset`` object to use with the Keras methods :meth:`fit`, :meth:`evaluate`
+            and :meth:`predict`.
+        """
+        return _sampled_sequence_to_tf_dataset(self, num_parallel_calls)
+
     def on_epoch_end(self):
         """
         Shuffle all link IDs at the end of each epoch
         """
-        self.indices = list(range(self.data_size))
         if self.shuffle:
-            self._rs.shuffle(self.indices)
+            self.indices = self._np_rs.permutation(self.data_size)
+        else:
+            self.indices = np.arange(self.data_size)
 
 
 class OnDemandLinkSequence(Sequence):
@@ -266,6 +408,10 @@ class OnDemandLinkSequence(Sequence):
         sample_function (Callable): A function that returns features for supplied head nodes.
         sampler (UnsupersizedSampler):  An object that encapsulates the neighbourhood sampling of a graph.
             The generator method of this class returns a batch of positive and negative samples on demand.
+
+    The samples are generated when each batch is requested, so ``data_size`` is only an upper bound
+    on the number of samples in an epoch: it's exact if no walks end early at a node without
+    neighbours. Root nodes without any neighbours are skipped.
     """
 
     def __init__(self, sample_function, batch_size, walker, shuffle=True):
@@ -287,10 +433,16 @@ class OnDemandLinkSequence(Sequence):
         self.batch_size = batch_size
         self.walker = walker
         self.shuffle = shuffle
-        # FIXME(#681): all batches are created at once, so this is no longer "on demand"
-        self._batches = self._create_batches()
-        self.length = len(self._batches)
-        self.data_size = sum(len(batch[0]) for batch in self._batches)
+
+        # Only the root nodes of the walks are split into batches up front: the walks and samples
+        # for each batch are generated when it is requested, from a seed that is fixed for each
+        # epoch, so that a batch is the same no matter when (or how many times) it is requested.
+        self._new_epoch()
+        self.length = len(self._batch_roots)
+        # the number of samples if no walks end early, which is an upper bound: walks that end at a
+        # node without neighbours produce fewer samples (root nodes without neighbours aren't used)
+        num_roots = sum(len(roots) for roots in self._batch_roots)
+        self.data_size = 2 * num_roots * (walker.length - 1)
 
     def __getitem__(self, batch_num):
         """
@@ -313,7 +465,9 @@ class OnDemandLinkSequence(Sequence):
         # print("Fetching {} batch {} [{}]".format(self.name, batch_num, start_idx))
 
         # Get head nodes and labels
-        head_ids, batch_targets = self._batches[batch_num]
+        head_ids, batch_targets = self.walker.run_batch(
+            self._batch_roots[batch_num], seed=self._batch_seeds[batch_num]
+        )
 
         # Obtain features for head ids
         batch_feats = self._sample_features(head_ids, batch_num)
@@ -324,31 +478,53 @@ class OnDemandLinkSequence(Sequence):
         """Denotes the number of batches per epoch"""
         return self.length
 
-    def _create_batches(self):
-        return self.walker.run(self.batch_size)
+    def _new_epoch(self):
+        # draw the seeds from the sampler's random state, so that the batches are reproducible when
+        # the sampler is seeded
+        np_rs = self.walker.np_random
+        self._batch_roots = self.walker.batch_root_nodes(
+            self.batch_size, seed=int(np_rs.randint(2 ** 32, dtype=np.int64))
+        )
+        self._batch_seeds = [
+            int(seed)
+            for seed in np_rs.randint(
+                2 ** 32, size=len(self._batch_roots), dtype=np.int64
+            )
+        ]
 
     def on_epoch_end(self):
         """
         Shuffle all link IDs at the end of each epoch
         """
         if self.shuffle:
-            self._batches = self._create_batches()
+            self._new_epoch()
 
 
-def _full_batch_array_and_reshape(array, propagate_none=False):
+def _full_batch_array_and_reshape(array):
     """
     Args:
         array: an array-like object
-        propagate_none: if True, return None when array is None
     Returns:
         array as a numpy array with an extra first dimension (batch dimension) equal to 1
     """
-    # if it's ok, just short-circuit on None (e.g. for target arrays, that may or may not exist)
-    if propagate_none and array is None:
-        return None
+    # np.asarray rather than np.asanyarray, because subclasses like np.matrix can't have 3 dimensions,
+    # and indexing with np.newaxis always gives a view, without copying
+    return np.asarray(array)[np.newaxis]
 
-    as_np = np.asanyarray(array)
-    return np.reshape(as_np, (1,) + as_np.shape)
+
+def _full_batch_sparse_indices_and_values(A):
+    """
+    Args:
+        A: a sparse matrix in COO format
+    Returns:
+        a tuple of the (nnz x 2) int64 array of indices and the array of values of A, each with an
+        extra first dimension (batch dimension) equal to 1
+    """
+    # fill a single preallocated array, casting to int64 (if required) as part of the copy
+    indices = np.empty((A.nnz, 2), dtype=np.int64)
+    indices[:, 0] = A.row
+    indices[:, 1] = A.col
+    return indices[None, ...], A.data[None, ...]
 
 
 class FullBatchSequence(Sequence):
@@ -381,10 +557,6 @@ class FullBatchSequence(Sequence):
                 "When passed together targets and indices should be the same length."
             )
 
-        # Store features and targets as np.ndarray
-        self.features = np.asanyarray(features)
-        self.target_indices = np.asanyarray(indices)
-
         # Convert sparse matrix to dense:
         if sps.issparse(A) and hasattr(A, "toarray"):
             self.A_dense = _full_batch_array_and_reshape(A.toarray())
@@ -400,7 +572,10 @@ class FullBatchSequence(Sequence):
         self.target_indices = _full_batch_array_and_reshape(indices)
         self.inputs = [self.features, self.target_indices, self.A_dense]
 
-        self.targets = _full_batch_array_and_reshape(targets, propagate_none=True)
+        # targets may not exist (e.g. for prediction)
+        self.targets = (
+            None if targets is None else _full_batch_array_and_reshape(targets)
+        )
 
     def __len__(self):
         return 1
@@ -451,10 +626,7 @@ class SparseFullBatchSequence(Sequence):
             raise ValueError("Adjacency matrix not in expected sparse format")
 
         # Convert matrices to list of indices & values
-        self.A_indices = np.expand_dims(
-            np.hstack((A.row[:, None], A.col[:, None])), 0
-        ).astype("int64")
-        self.A_values = np.expand_dims(A.data, 0)
+        self.A_indices, self.A_values = _full_batch_sparse_indices_and_values(A)
 
         # Reshape all inputs to have batch dimension of 1
         self.target_indices = _full_batch_array_and_reshape(indices)
@@ -466,7 +638,10 @@ class SparseFullBatchSequence(Sequence):
             self.A_values,
         ]
 
-        self.targets = _full_batch_array_and_reshape(targets, propagate_none=True)
+        # targets may not exist (e.g. for prediction)
+        self.targets = (
+            None if targets is None else _full_batch_array_and_reshape(targets)
+        )
 
     def __len__(self):
         return 1
@@ -510,21 +685,37 @@ class RelationalFullBatchNodeSequence(Sequence):
 
         # Convert all adj matrices to dense and reshape to have batch dimension of 1
         if self.use_sparse:
-            self.A_indices = [
-                np.expand_dims(np.hstack((A.row[:, None], A.col[:, None])), 0)
-                for A in As
-            ]
-            self.A_values = [np.expand_dims(A.data, 0) for A in As]
+            indices_and_values = [_full_batch_sparse_indices_and_values(A) for A in As]
+            self.A_indices = [indices for indices, _ in indices_and_values]
+            self.A_values = [values for _, values in indices_and_values]
             self.As = self.A_indices + self.A_values
         else:
-            self.As = [np.expand_dims(A.todense(), 0) for A in As]
+            # densify every matrix directly into a single preallocated array, rather than separate
+            # np.matrix objects or temporary arrays, and keep each relationship as a view for the
+            # model inputs (scipy adds into ``out``, so it must start as zeros). The array has a
+            # type that holds every matrix's values, so none are truncated (np.result_type is
+            # limited to 32 arguments, so the types are promoted pairwise).
+            num_nodes = np.shape(features)[0]
+            if As:
+                dtype = reduce(np.promote_types, [A.dtype for A in As])
+            else:
+                dtype = np.float64
+            self.As_dense = np.zeros((len(As), 1, num_nodes, num_nodes), dtype=dtype)
+            for i, A in enumerate(As):
+                A.astype(self.As_dense.dtype, copy=False).toarray(
+                    out=self.As_dense[i, 0]
+                )
+            self.As = list(self.As_dense)
 
         # Make sure all inputs are numpy arrays, and have batch dimension of 1
         self.target_indices = _full_batch_array_and_reshape(indices)
         self.features = _full_batch_array_and_reshape(features)
         self.inputs = [self.features, self.target_indices] + self.As
 
-        self.targets = _full_batch_array_and_reshape(targets, propagate_none=True)
+        # targets may not exist (e.g. for prediction)
+        self.targets = (
+            None if targets is None else _full_batch_array_and_reshape(targets)
+        )
 
     def __len__(self):
         return 1
@@ -533,6 +724,44 @@ class RelationalFullBatchNodeSequence(Sequence):
         return self.inputs, self.targets
 
 
+def _flat_batch_elements(offsets, batch_indices):
+    """
+    Finds the elements of a batch of graphs in a flat array that stores the elements of graph i at
+    [offsets[i], offsets[i + 1]).
+
+    Args:
+        offsets (np.ndarray): the offsets of the elements of each graph in the flat array
+        batch_indices (np.ndarray): the indices of the graphs in the batch
+
+    Returns:
+        A tuple of arrays with, for each element of the batch's graphs: its index in the flat
+        array, the position of its graph in the batch, and its position within its graph
+    """
+    starts = offsets[batch_indices]
+    counts = offsets[batch_indices + 1] - starts
+
+    batch_starts = np.cumsum(counts) - counts
+    positions_in_graph = np.arange(counts.sum()) - np.repeat(batch_starts, counts)
+    elements = positions_in_graph + np.repeat(starts, counts)
+    graph_positions = np.repeat(np.arange(len(batch_indices)), counts)
+
+    return elements, graph_positions, positions_in_graph
+
+
+def _graph_adjacency(graph, normalize):
+    """
+    Args:
+        graph (StellarGraph): a graph
+        normalize (bool): whether to normalize the adjacency matrix
+    Returns:
+        the (normalized) adjacency matrix of the graph, as a float32 sparse matrix
+    """
+    adj = graph.to_adjacency_matrix()
+    if normalize:
+        adj = normalize_adj(adj)
+    return adj.astype(np.float32)
+
+
 class GraphSequence(Sequence):
     """
     A Keras-compatible data generator for training and evaluating graph classification models.
@@ -551,15 +780,41 @@ class GraphSequence(Sequence):
             be normalized or not. The default is True.
         batch_size (int, optional): The batch size. It defaults to 1.
         name (str, optional): An optional name for this generator object.
+        bucket_shuffle (bool, optional): If True, each batch is formed from graphs of similar
+            sizes, and the order of the batches is shuffled every epoch. This reduces the padding
+            of the adjacency and feature matrices when the graph sizes vary widely. If False (the
+            default), the graphs are shuffled uniformly every epoch.
+        dense_cache (bool, optional): If True (the default), and the padded dense adjacency
+            matrices of all graphs fit in ``dense_cache_max_bytes``, they are computed once and
+            stored. Otherwise, the adjacency matrices are stored as sparse matrices and converted
+            to dense for each batch, which uses less memory for many or large graphs.
+        dense_cache_max_bytes (int, optional): The maximum memory, in bytes, to use for the dense
+            adjacency matrices, each of which is padded to the size of the largest graph. The
+            default is 256 MiB.
+        n_jobs (int, optional): The number of threads to use to compute the (normalized) adjacency
+            matrices of the graphs. If None (the default), this is chosen based on the number of
+            CPUs.
     """
 
-    def __init__(self, graphs, targets=None, normalize=True, batch_size=1, name=None):
+    def __init__(
+        self,
+        graphs,
+        targets=None,
+        normalize=True,
+        batch_size=1,
+        name=None,
+        bucket_shuffle=False,
+        dense_cache=True,
+        dense_cache_max_bytes=2 ** 28,
+        n_jobs=None,
+    ):
 
         self.name = name
         self.graphs = np.asanyarray(graphs)
         self.normalize_adj = normalize
         self.targets = targets
         self.batch_size = batch_size
+        self.bucket_shuffle = bucket_shuffle
 
         if targets is not None:
             if len(graphs) != len(targets):
@@ -570,14 +825,62 @@ class GraphSequence(Sequence):
 
             self.targets = np.asanyarray(targets)
 
-        if self.normalize_adj:
-            self.normalized_adjs = [
-                normalize_adj(graph.to_adjacency_matrix()) for graph in graphs
-            ]
+        if n_jobs == 1:
+            adjs = [_graph_adjacency(graph, normalize) for graph in graphs]
         else:
-            self.normalize_adjs = [graph.to_adjacency_matrix() for graph in graphs]
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                adjs = list(
+                    executor.map(_graph_adjacency, graphs, it.repeat(normalize))
+                )
 
-        self.normalized_adjs = np.asanyarray(self.normalized_adjs)
+        # The graphs, features and adjacency matrices don't change between epochs, so they are
+        # computed once, here, rather than for every batch. Each batch is padded to the size of the
+        # largest graph in it.
+        self._num_nodes = np.array([graph.number_of_nodes() for graph in graphs])
+        max_nodes = self._num_nodes.max()
+
+        # the (unpadded) features of all graphs are stored in a single flat array, with the
+        # features of graph i at rows [self._node_offsets[i], self._node_offsets[i + 1]), and each
+        # graph's features are written directly into it
+        self._node_offsets = np.cumsum(np.concatenate([[0], self._num_nodes]))
+        first_features = graphs[0].node_features(graphs[0].nodes())
+        self._features = np.empty(
+            (self._node_offsets[-1], first_features.shape[1]),
+            dtype=first_features.dtype,
+        )
+        for start, end, graph in zip(
+            self._node_offsets[:-1], self._node_offsets[1:], graphs
+        ):
+            self._features[start:end] = graph.node_features(graph.nodes())
+
+        # the dense adjacency matrices use memory quadratic in the size of the largest graph (for
+        # every graph), so they're only cached when they fit in the limit
+        dense_cache_bytes = len(graphs) * max_nodes ** 2 * np.dtype(np.float32).itemsize
+        if dense_cache and dense_cache_bytes <= dense_cache_max_bytes:
+            self._padded_adjs = np.zeros(
+                (len(graphs), max_nodes, max_nodes), dtype=np.float32
+            )
+            for i, (n, adj) in enumerate(zip(self._num_nodes, adjs)):
+                self._padded_adjs[i, :n, :n] = adj.toarray()
+        else:
+            self._padded_adjs = None
+
+            # store the non-zero elements of all the adjacency matrices in flat arrays, with the
+            # elements of graph i at [self._adj_offsets[i], self._adj_offsets[i + 1])
+            coos = [adj.tocoo() for adj in adjs]
+            for coo in coos:
+                coo.sum_duplicates()
+
+            self._adj_offsets = np.cumsum([0] + [coo.nnz for coo in coos])
+            self._adj_rows = np.concatenate([coo.row for coo in coos])
+            self._adj_cols = np.concatenate([coo.col for coo in coos])
+            self._adj_values = np.concatenate([coo.data for coo in coos])
+
+        # when every graph has the same number of nodes (and the adjacency matrices are cached)
+        # there's no padding to trim, so each batch is a plain gather from the cached arrays
+        self._homogeneous = (
+            self._padded_adjs is not None and self._num_nodes.min() == max_nodes
+        )
 
         self.on_epoch_end()
 
@@ -587,36 +890,47 @@ class GraphSequence(Sequence):
     def __getitem__(self, index):
 
         batch_start, batch_end = index * self.batch_size, (index + 1) * self.batch_size
-
-        graphs = self.graphs[batch_start:batch_end]
-        adj_graphs = self.normalized_adjs[batch_start:batch_end]
-
-        # The number of nodes for the largest graph in the batch. We are going to pad with 0 rows and columns
-        # the adjacency and node feature matrices (only the rows in this case) to equal in size the adjacency and
-        # feature matrices of the largest graph.
-        max_nodes = max([graph.number_of_nodes() for graph in graphs])
+        batch_indices = self.indices[batch_start:batch_end]
 
         graph_targets = None
         if self.targets is not None:
-            graph_targets = self.targets[batch_start:batch_end]
+            graph_targets = self.targets[batch_indices]
 
-        # pad adjacency and feature matrices to equal the size of those from the largest graph
-        features = [
-            np.pad(
-                graph.node_features(graph.nodes()),
-                pad_width=((0, max_nodes - graph.number_of_nodes()), (0, 0)),
+        if self._homogeneous:
+            # the flat features of graphs of equal size are a (graphs x N x F) array without padding
+            num_nodes = self._num_nodes[0]
+            features = self._features.reshape(
+                len(self.graphs), num_nodes, self._features.shape[1]
+            )
+            return (
+                [
+                    features[batch_indices],
+                    np.ones((len(batch_indices), num_nodes), dtype=bool),
+                    self._padded_adjs[batch_indices],
+                ],
+                graph_targets,
             )
-            for graph in graphs
-        ]
-        features = np.stack(features)
-
-        for adj in adj_graphs:
-            adj.resize((max_nodes, max_nodes))
-        adj_graphs = np.stack([adj.toarray() for adj in adj_graphs])
 
-        masks = np.full((len(graphs), max_nodes), fill_value=False, dtype=np.bool)
-        for index, graph in enumerate(graphs):
-            masks[index, : graph.number_of_nodes()] = True
+        # The number of nodes for the largest graph in the batch. The adjacency and node feature
+        # matrices (only the rows in this case) are padded with 0 rows and columns to equal in size
+        # the adjacency and feature matrices of this graph.
+        num_nodes = self._num_nodes[batch_indices]
+        max_nodes = num_nodes.max()
+
+        elements, graph_positions, node_positions = _flat_batch_elements(
+            self._node_offsets, batch_indices
+        )
+        features = np.zeros(
+            (len(batch_indices), max_nodes, self._features.shape[1]),
+            dtype=self._features.dtype,
+        )
+        features[graph_positions, node_positions] = self._features[elements]
+
+        masks = np.arange(max_nodes) < num_nodes[:, None]
+        if self._padded_adjs is not None:
+            adj_graphs = self._padded_adjs[batch_indices, :max_nodes, :max_nodes]
+        else:
+            adj_graphs = self._dense_adjs(batch_indices, max_nodes)
 
         # features is array of dimensionality
         #      batch size x N x F
@@ -630,16 +944,48 @@ class GraphSequence(Sequence):
         # the node feature dimensionality, and C is the number of target classes
         return [features, masks, adj_graphs], graph_targets
 
+    def _dense_adjs(self, batch_indices, max_nodes):
+        """
+        Scatter the non-zero elements of the adjacency matrices of a batch of graphs into a single
+        dense array, without converting each matrix to dense separately.
+        """
+        elements, graph_positions, _ = _flat_batch_elements(
+            self._adj_offsets, batch_indices
+        )
+
+        adj_graphs = np.zeros(
+            (len(batch_indices), max_nodes, max_nodes), dtype=np.float32
+        )
+        adj_graphs[
+            graph_positions, self._adj_rows[elements], self._adj_cols[elements]
+        ] = self._adj_values[elements]
+        return adj_graphs
+
     def on_epoch_end(self):
         """
          Shuffle all graphs at the end of each epoch
         """
-        indexes = list(range(len(self.graphs)))
-        random.shuffle(indexes)
-        self.graphs = self.graphs[indexes]
-        self.normalized_adjs = self.normalized_adjs[indexes]
-        if self.targets is not None:
-            self.targets = self.targets[indexes]
+        indices = np.arange(len(self.graphs))
+        random.shuffle(indices)
+
+        if self.bucket_shuffle:
+            # a stable sort by size keeps graphs of equal size in their shuffled order, so the
+            # batches of similarly sized graphs differ between epochs (kind="stable" needs NumPy
+            # 1.15, but mergesort is stable in all versions)
+            indices = indices[np.argsort(self._num_nodes[indices], kind="mergesort")]
+
+            # shuffle the order of the full batches, keeping any partial batch at the end
+            num_full = len(indices) // self.batch_size
+            full_size = num_full * self.batch_size
+            batch_order = np.arange(num_full)
+            random.shuffle(batch_order)
+
+            full_batches = indices[:full_size].reshape(num_full, self.batch_size)
+            indices = np.concatenate(
+                [full_batches[batch_order].ravel(), indices[full_size:]]
+            )
+
+        self.indices = indices
 
 
 class CorruptedNodeSequence(Sequence):
@@ -649,9 +995,10 @@ class CorruptedNodeSequence(Sequence):
 
     Args:
         base_generator: the uncorrupted Sequence object.
+        seed (int, optional): Random seed for shuffling the node features.
     """
 
-    def __init__(self, base_generator):
+    def __init__(self, base_generator, seed=None):
 
         if not isinstance(base_generator, (FullBatchSequence, SparseFullBatchSequence)):
             raise TypeError(
@@ -663,6 +1010,9 @@ class CorruptedNodeSequence(Sequence):
         self.targets = np.zeros((1, len(base_generator.target_indices), 2))
         self.targets[0, :, 0] = 1.0
 
+        self._num_nodes = base_generator.features.shape[1]
+        _, self._np_rs = random_state(seed)
+
     def __len__(self):
         return len(self.base_generator)
 
@@ -671,7 +1021,11 @@ class CorruptedNodeSequence(Sequence):
         inputs, _ = self.base_generator[index]
         features = inputs[0]
 
-        shuffled_idxs = np.random.permutation(features.shape[1])
-        shuffled_feats = features[:, shuffled_idxs, :]
+        # the features are the base generator's stored array, so they can't be shuffled in place:
+        # gathering them in the shuffled order is a single copy. The permutation is local to each
+        # call, so that batches can be computed concurrently (e.g. by Keras worker threads).
+        shuffled_feats = np.take(
+            features, self._np_rs.permutation(self._num_nodes), axis=1
+        )
 
         return [shuffled_feats] + inputs, self.targets
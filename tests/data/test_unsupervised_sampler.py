@@ -17,9 +17,11 @@
 import pytest
 
 import numpy as np
+import pandas as pd
 from collections import defaultdict
+from stellargraph import StellarGraph
 from stellargraph.data.unsupervised_sampler import UnsupervisedSampler
-from ..test_utils.graphs import line_graph
+from ..test_utils.graphs import line_graph, node_features
 
 
 class TestUnsupervisedSampler(object):
@@ -81,3 +83,62 @@ class TestUnsupervisedSampler(object):
             for context, label in sampled:
                 if label == 1:
                     assert context in set(line_graph.neighbors(target))
+
+    def test_batch_root_nodes(self, line_graph):
+        sampler = UnsupervisedSampler(G=line_graph, length=3, number_of_walks=2)
+
+        # each walk of length 3 produces 2 positive and 2 negative samples
+        batches = sampler.batch_root_nodes(batch_size=8, seed=1)
+        assert all(len(roots) <= 2 for roots in batches)
+
+        all_roots = [root for roots in batches for root in roots]
+        assert sorted(all_roots) == sorted(list(line_graph.nodes()) * 2)
+
+        # a batch size smaller than the samples from one walk still gets one root node per batch
+        # (and so more than batch_size samples)
+        batches = sampler.batch_root_nodes(batch_size=2, seed=1)
+        assert len(batches) == len(line_graph.nodes()) * 2
+        assert all(len(roots) == 1 for roots in batches)
+        ids, _ = sampler.run_batch(batches[0], seed=1)
+        assert len(ids) <= 4
+
+        # reproducible with a seed
+        first = sampler.batch_root_nodes(batch_size=8, seed=1)
+        second = sampler.batch_root_nodes(batch_size=8, seed=1)
+        assert first == second
+
+    def test_batch_root_nodes_no_neighbours(self):
+        # nodes 8 and 9 have no neighbours, so their walks have no samples
+        edges = pd.DataFrame(
+            [(i, i + 1) for i in range(7)], columns=["source", "target"]
+        )
+        graph = StellarGraph(node_features(), edges)
+        sampler = UnsupervisedSampler(G=graph, length=3, number_of_walks=2)
+
+        batches = sampler.batch_root_nodes(batch_size=4, seed=1)
+        assert all(len(roots) == 1 for roots in batches)
+
+        all_roots = [root for roots in batches for root in roots]
+        assert sorted(all_roots) == sorted(list(range(8)) * 2)
+
+        # no batch is empty
+        for i, roots in enumerate(batches):
+            ids, labels = sampler.run_batch(roots, seed=i)
+            assert len(ids) == len(labels) > 0
+
+    def test_run_batch(self, line_graph):
+        sampler = UnsupervisedSampler(G=line_graph, length=2, number_of_walks=1)
+        roots = list(line_graph.nodes())[:3]
+
+        ids, labels = sampler.run_batch(roots, seed=2)
+        assert len(ids) == len(labels) == 2 * len(roots)
+        assert sum(labels) == len(roots)
+        assert sorted(target for target, _ in ids) == sorted(roots * 2)
+
+        for (target, context), label in zip(ids, labels):
+            if label == 1:
+                assert context in set(line_graph.neighbors(target))
+
+        ids_again, labels_again = sampler.run_batch(roots, seed=2)
+        np.testing.assert_array_equal(ids, ids_again)
+        np.testing.assert_array_equal(labels, labels_again)
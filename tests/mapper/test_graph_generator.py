@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stellargraph.core.graph import StellarGraph
+from stellargraph.core.utils import normalize_adj
+from stellargraph.mapper import GraphGenerator, GraphSequence
+from ..test_utils.graphs import repeated_features
+from .. import test_utils
+
+
+pytestmark = [
+    test_utils.ignore_stellargraph_experimental_mark,
+    pytest.mark.filterwarnings(
+        r"ignore:GraphGenerator:stellargraph.core.experimental.ExperimentalWarning"
+    ),
+]
+
+
+def path_graph(num_nodes, feature_size=2, feature_value=None):
+    # by default, the features of each node are equal to the size of the graph, to identify the
+    # graph in a batch
+    if feature_value is None:
+        feature_value = num_nodes
+
+    nodes = pd.DataFrame(
+        repeated_features([feature_value] * num_nodes, feature_size),
+        index=range(num_nodes),
+    )
+    edges = pd.DataFrame(
+        [(i, i + 1) for i in range(num_nodes - 1)], columns=["source", "target"]
+    )
+    return StellarGraph(nodes, edges)
+
+
+@pytest.fixture
+def graphs():
+    return [path_graph(n) for n in [2, 5, 3, 4, 6, 3]]
+
+
+def check_batch(batch, graphs_by_size):
+    [features, masks, adjs], targets = batch
+
+    batch_size = len(targets)
+    max_nodes = max(targets)
+    assert features.shape == (batch_size, max_nodes, 2)
+    assert masks.shape == (batch_size, max_nodes)
+    assert adjs.shape == (batch_size, max_nodes, max_nodes)
+
+    for feats, mask, adj, num_nodes in zip(features, masks, adjs, targets):
+        np.testing.assert_array_equal(feats[:num_nodes], num_nodes)
+        np.testing.assert_array_equal(feats[num_nodes:], 0)
+
+        np.testing.assert_array_equal(mask[:num_nodes], True)
+        np.testing.assert_array_equal(mask[num_nodes:], False)
+
+        expected_adj = normalize_adj(
+            graphs_by_size[num_nodes].to_adjacency_matrix()
+        ).toarray()
+        np.testing.assert_allclose(
+            adj[:num_nodes, :num_nodes], expected_adj, rtol=1e-6
+        )
+        np.testing.assert_array_equal(adj[num_nodes:, :], 0)
+        np.testing.assert_array_equal(adj[:, num_nodes:], 0)
+
+
+@pytest.mark.parametrize("bucket_shuffle", [False, True])
+@pytest.mark.parametrize("batch_size", [1, 2, 4, 6])
+def test_graph_sequence(graphs, batch_size, bucket_shuffle):
+    graphs_by_size = {g.number_of_nodes(): g for g in graphs}
+    targets = [g.number_of_nodes() for g in graphs]
+
+    seq = GraphGenerator(graphs).flow(
+        range(len(graphs)),
+        targets=targets,
+        batch_size=batch_size,
+        bucket_shuffle=bucket_shuffle,
+    )
+    assert len(seq) == int(np.ceil(len(graphs) / batch_size))
+
+    for epoch in range(2):
+        seen = []
+        for i in range(len(seq)):
+            batch = seq[i]
+            check_batch(batch, graphs_by_size)
+            seen.extend(batch[1])
+
+        assert sorted(seen) == sorted(targets)
+        seq.on_epoch_end()
+
+
+def test_graph_sequence_bucket_shuffle(graphs):
+    targets = [g.number_of_nodes() for g in graphs]
+    seq = GraphGenerator(graphs).flow(
+        range(len(graphs)), targets=targets, batch_size=2, bucket_shuffle=True
+    )
+
+    for epoch in range(3):
+        # the graphs of sizes [2, 3, 3, 4, 5, 6] are batched in sorted order
+        batch_sizes = sorted(tuple(sorted(seq[i][1])) for i in range(len(seq)))
+        assert batch_sizes == [(2, 3), (3, 4), (5, 6)]
+        seq.on_epoch_end()
+
+
+@pytest.mark.parametrize("dense_cache_max_bytes", [0, 863, 864])
+def test_graph_sequence_dense_cache(graphs, dense_cache_max_bytes):
+    graphs_by_size = {g.number_of_nodes(): g for g in graphs}
+    targets = [g.number_of_nodes() for g in graphs]
+
+    seq = GraphGenerator(graphs).flow(
+        range(len(graphs)),
+        targets=targets,
+        batch_size=2,
+        dense_cache_max_bytes=dense_cache_max_bytes,
+    )
+    # 6 graphs padded to the largest graph of 6 nodes, with 4-byte floats
+    assert (seq._padded_adjs is not None) == (dense_cache_max_bytes >= 864)
+
+    for i in range(len(seq)):
+        batch = seq[i]
+        assert batch[0][2].dtype == np.float32
+        check_batch(batch, graphs_by_size)
+
+
+@pytest.mark.parametrize("n_jobs", [None, 1, 3])
+def test_graph_sequence_n_jobs(graphs, n_jobs):
+    graphs_by_size = {g.number_of_nodes(): g for g in graphs}
+    targets = [g.number_of_nodes() for g in graphs]
+
+    seq = GraphGenerator(graphs).flow(
+        range(len(graphs)), targets=targets, batch_size=3, n_jobs=n_jobs
+    )
+    for i in range(len(seq)):
+        check_batch(seq[i], graphs_by_size)
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 4])
+def test_graph_sequence_homogeneous(batch_size):
+    graphs = [path_graph(4, feature_value=i) for i in range(10)]
+    expected_adj = normalize_adj(graphs[0].to_adjacency_matrix()).toarray()
+
+    seq = GraphSequence(graphs, targets=np.arange(10), batch_size=batch_size)
+    assert seq._homogeneous
+
+    for epoch in range(2):
+        seen = []
+        for i in range(len(seq)):
+            [features, masks, adjs], targets = seq[i]
+            assert features.shape == (len(targets), 4, 2)
+            assert masks.shape == (len(targets), 4)
+            assert adjs.shape == (len(targets), 4, 4)
+
+            # the features and targets of each graph stay together when shuffled
+            np.testing.assert_array_equal(features[:, 0, 0], targets)
+            assert masks.all()
+            for adj in adjs:
+                np.testing.assert_allclose(adj, expected_adj, rtol=1e-6)
+
+            seen.extend(targets)
+
+        assert sorted(seen) == list(range(10))
+        seq.on_epoch_end()
+
+    # graphs of the same size without the dense cache use the general path
+    seq = GraphSequence(graphs, targets=np.arange(10), dense_cache=False)
+    assert not seq._homogeneous
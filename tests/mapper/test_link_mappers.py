@@ -147,6 +147,8 @@ class Test_GraphSAGELinkGenerator:
         assert generator.batch_size == self.batch_size
         assert mapper.data_size == G.number_of_edges()
         assert len(mapper.ids) == G.number_of_edges()
+        assert mapper.ids.shape == (G.number_of_edges(), 2)
+        np.testing.assert_array_equal(mapper.ids, list(G.edges()))
 
         G = example_graph(feature_size=self.n_feat, is_directed=True)
         edge_labels = [0] * G.number_of_edges()
@@ -215,6 +217,28 @@ class Test_GraphSAGELinkGenerator:
         test_edge_consistency(True)
         test_edge_consistency(False)
 
+    def test_GraphSAGELinkGenerator_to_tf_dataset(self):
+        G = example_graph(feature_size=1)
+        edges = list(G.edges())
+        edge_labels = list(range(len(edges)))
+
+        mapper = GraphSAGELinkGenerator(G, batch_size=2, num_samples=[0]).flow(
+            edges, edge_labels
+        )
+        batches = list(mapper.to_tf_dataset().as_numpy_iterator())
+        assert len(batches) == len(mapper)
+
+        seen = []
+        for nf, nl in batches:
+            assert len(nf) == 2
+            for i, label in enumerate(nl):
+                src, dst = edges[label]
+                assert nf[0][i, 0, 0] == src
+                assert nf[1][i, 0, 0] == dst
+            seen.extend(nl)
+
+        assert sorted(seen) == edge_labels
+
     # def test_GraphSAGELinkGenerator_2(self):
     #
     #     G = example_graph(feature_size=self.n_feat)
@@ -367,6 +391,29 @@ class Test_GraphSAGELinkGenerator:
                 G, batch_size=n_batch, num_samples=n_samples
             ).flow()
 
+    def test_GraphSAGELinkGenerator_unsupervisedSampler_on_demand(self):
+        G = example_graph(feature_size=self.n_feat)
+
+        unsupervisedSamples = UnsupervisedSampler(G, length=3, seed=3)
+        mapper = GraphSAGELinkGenerator(
+            G, batch_size=4, num_samples=self.num_samples
+        ).flow(unsupervisedSamples)
+
+        # each batch is generated when requested, and is the same within an epoch
+        for batch in range(len(mapper)):
+            nf, nl = mapper[batch]
+            nf_again, nl_again = mapper[batch]
+            np.testing.assert_array_equal(nl, nl_again)
+            for x, x_again in zip(nf, nf_again):
+                assert x.shape == x_again.shape
+
+        # every root node is used once per epoch
+        roots = [root for batch in mapper._batch_roots for root in batch]
+        assert sorted(roots) == sorted(G.nodes())
+
+        mapper.on_epoch_end()
+        assert len(mapper) == len(mapper._batch_roots)
+
     def test_GraphSAGELinkGenerator_unsupervisedSampler_sample_generation(self):
 
         G = example_graph(feature_size=self.n_feat)
@@ -225,6 +225,73 @@ def test_nodemapper_shuffle(shuffle):
         assert False in comparison_results
 
 
+@pytest.mark.parametrize("shuffle", [True, False])
+def test_nodemapper_to_tf_dataset(shuffle):
+    n_feat = 1
+    n_batch = 2
+
+    G = example_graph_2(feature_size=n_feat)
+    nodes = list(G.nodes())
+
+    seq = GraphSAGENodeGenerator(G, batch_size=n_batch, num_samples=[2]).flow(
+        nodes, nodes, shuffle=shuffle
+    )
+    dataset = seq.to_tf_dataset()
+
+    batches = list(dataset.as_numpy_iterator())
+    assert len(batches) == len(seq)
+
+    features = []
+    for nf, nl in batches:
+        assert len(nf) == 2
+        assert nf[0].shape == (len(nl), 1, n_feat)
+        assert nf[1].shape == (len(nl), 2, n_feat)
+        # the features of each node are equal to its ID
+        np.testing.assert_array_equal(np.ravel(nf[0]), nl)
+        features.extend(nl)
+
+    assert sorted(features) == nodes
+    if not shuffle:
+        assert features == nodes
+
+
+def test_nodemapper_to_tf_dataset_no_targets():
+    n_feat = 1
+    G = example_graph_2(feature_size=n_feat)
+    nodes = list(G.nodes())
+
+    # a list of 2 feature arrays, which Keras could mistake for (x, y)
+    seq = GraphSAGENodeGenerator(G, batch_size=2, num_samples=[2]).flow(nodes)
+    batches = list(seq.to_tf_dataset().as_numpy_iterator())
+    assert len(batches) == len(seq)
+
+    features = []
+    for (nf,) in batches:
+        assert len(nf) == 2
+        assert nf[1].shape == (len(nf[0]), 2, n_feat)
+        features.extend(np.ravel(nf[0]))
+
+    assert features == nodes
+
+
+def test_nodemapper_to_tf_dataset_single_array():
+    n_feat = 3
+    G = example_graph_2(feature_size=n_feat)
+    nodes = list(G.nodes())
+
+    # Attri2Vec samples a single feature array, rather than a list
+    seq = Attri2VecNodeGenerator(G, batch_size=2).flow(nodes)
+    batches = list(seq.to_tf_dataset().as_numpy_iterator())
+    assert len(batches) == len(seq)
+
+    features = []
+    for (nf,) in batches:
+        assert nf.shape[1:] == (n_feat,)
+        features.extend(nf[:, 0])
+
+    assert features == nodes
+
+
 def test_nodemapper_with_labels():
     n_feat = 4
     n_batch = 2
@@ -929,3 +996,25 @@ def test_corrupt_full_batch_generator(sparse):
         )
         for i in range(shuffled_feats.shape[1])
     )
+
+
+def test_corrupt_full_batch_generator_seed():
+    G = example_graph_random(n_nodes=20)
+    base_gen = FullBatchNodeGenerator(G).flow(G.nodes())
+    base_features = base_gen.features.copy()
+
+    def shuffled_features(seed):
+        [shuffled_feats, *_], _ = CorruptedNodeSequence(base_gen, seed=seed)[0]
+        return shuffled_feats
+
+    np.testing.assert_array_equal(shuffled_features(1), shuffled_features(1))
+    assert not np.array_equal(shuffled_features(1), shuffled_features(2))
+
+    # corrupting the features doesn't modify the base generator
+    np.testing.assert_array_equal(base_gen.features, base_features)
+
+    # the seed is passed through CorruptedGenerator
+    corrupted_gen = CorruptedGenerator(FullBatchNodeGenerator(G))
+    [first, *_], _ = corrupted_gen.flow(G.nodes(), seed=1)[0]
+    [second, *_], _ = corrupted_gen.flow(G.nodes(), seed=1)[0]
+    np.testing.assert_array_equal(first, second)